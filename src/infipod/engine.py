@@ -1,24 +1,55 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator, Iterable, Mapping
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable, Iterator, Mapping
 from contextlib import asynccontextmanager
 from os import PathLike
 from ssl import SSLContext
 from typing import Any, cast, overload
+from weakref import WeakKeyDictionary
 
-import attr
 import pg_purepy
 import structlog
-from pg_purepy.messages import DataRow
+from pg_purepy.messages import DataRow, RowDescription
 
 from infipod.schema import Column, TableSchema
 from infipod.types import DatabaseTypeWithConverter
-from infipod.util import map_as_completed
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(name=__name__)
 
 type SchemaMapping = Mapping[type[TableSchema], TableSchema]
 
+#: Mapping of (table OID, column index) -> position in a :class:`.DataRow`.
+type ColumnIndex = dict[tuple[int | None, int | None], int]
+
+type _LoadedSchemas = tuple[SchemaMapping, list[pg_purepy.Converter]]
+
+# several tables may share a name across schemas (e.g. a temporary table shadowing a permanent
+# one), so tables visible on the search path are sorted first and only the first OID seen for each
+# name is used.
+#
+# the confusingly named ``pg_attribute`` table stores all of the actual columns...
+# attnum: The number of the column. Ordinary columns are numbered from 1 up.
+#         System columns, such as ctid, have (arbitrary) negative numbers.
+_PG_CLASS_ATTR_QUERY = """
+SELECT c.oid, c.relname, a.attname, a.attnum FROM pg_class c
+JOIN pg_attribute a ON a.attrelid = c.oid
+WHERE c.relname = ANY($1::text[]) AND c.relkind = 'r' AND a.attnum > 0
+ORDER BY c.relname, pg_table_is_visible(c.oid) DESC, c.oid, a.attnum;
+"""
+
+# likewise, each type name maps to exactly one OID, preferring the type visible on the search path.
+_PG_TYPE_QUERY = """
+SELECT DISTINCT ON (typname) typname, oid FROM pg_type
+WHERE typname = ANY($1::text[])
+ORDER BY typname, pg_type_is_visible(oid) DESC, oid;
+"""
+
+# pool -> (schema types, strict) -> previously loaded schemas and converters
+_SCHEMA_CACHE: WeakKeyDictionary[
+    pg_purepy.PooledDatabaseInterface,
+    dict[tuple[frozenset[type[TableSchema]], bool], _LoadedSchemas],
+] = WeakKeyDictionary()
+
 
 class SchemaLoadFailedError(Exception):
     """
@@ -39,6 +70,14 @@ class IsopodPool:
         self._connection = pool
         self._schemas = schemas
 
+        # Column -> (table OID, column index), i.e. the key into a row's ColumnIndex. this is
+        # computed once here so that row lookups don't have to go through the table schema.
+        self._column_keys: dict[Column[Any], tuple[int, int]] = {
+            column: (schema.oid, column_idx)
+            for schema in schemas.values()
+            for column, column_idx in schema.column_mapping.items()
+        }
+
     @asynccontextmanager
     async def checkout_isopod(self) -> AsyncGenerator[Isopod, None]:
         """
@@ -74,9 +113,21 @@ class IsopodPool:
         Executes a query and fetches a list of :class:`.EnhancedRow` instances.
         """
 
-        return [
-            EnhancedRow(self, it) for it in await self._connection.fetch(query, *args, **kwargs)
-        ]
+        return list(_enhance_rows(self, await self._connection.fetch(query, *args, **kwargs)))
+
+    async def fetch_iter(
+        self,
+        query: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncIterator[EnhancedRow]:
+        """
+        Like :meth:`.IsopodPool.fetch`, but yields :class:`.EnhancedRow` instances one at a time
+        instead of building a list of them.
+        """
+
+        for row in _enhance_rows(self, await self._connection.fetch(query, *args, **kwargs)):
+            yield row
 
     async def fetch_one(
         self,
@@ -91,14 +142,21 @@ class IsopodPool:
         return EnhancedRow(self, await self._connection.fetch_one(query, *args, **kwargs))
 
 
-@attr.s(slots=True, kw_only=True)
 class Isopod:
     """
     A single isopod wrapping a checked out connection in a transaction.
     """
 
-    connection: pg_purepy.AsyncPostgresConnection = attr.ib()
-    pool: IsopodPool = attr.ib()
+    __slots__ = ("connection", "pool")
+
+    def __init__(  # noqa: D107
+        self,
+        *,
+        connection: pg_purepy.AsyncPostgresConnection,
+        pool: IsopodPool,
+    ) -> None:
+        self.connection = connection
+        self.pool = pool
 
     async def execute(
         self,
@@ -123,9 +181,21 @@ class Isopod:
         Executes a query and fetches a list of :class:`.EnhancedRow` instances.
         """
 
-        return [
-            EnhancedRow(self.pool, it) for it in await self.connection.fetch(query, *args, **kwargs)
-        ]
+        return list(_enhance_rows(self.pool, await self.connection.fetch(query, *args, **kwargs)))
+
+    async def fetch_iter(
+        self,
+        query: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncIterator[EnhancedRow]:
+        """
+        Like :meth:`.Isopod.fetch`, but yields :class:`.EnhancedRow` instances one at a time
+        instead of building a list of them.
+        """
+
+        for row in _enhance_rows(self.pool, await self.connection.fetch(query, *args, **kwargs)):
+            yield row
 
     async def fetch_one(
         self,
@@ -140,14 +210,68 @@ class Isopod:
         return EnhancedRow(self.pool, await self.connection.fetch_one(query, *args, **kwargs))
 
 
+def _index_columns(description: RowDescription) -> ColumnIndex:
+    """
+    Builds the (table OID, column index) -> row position mapping for a row description.
+    """
+
+    index: ColumnIndex = {}
+    for idx, desc in enumerate(description.columns):
+        table_oid = desc.table_oid
+        # computed values (e.g. ``SELECT 1``) don't belong to a table and can never be looked up.
+        if not table_oid:
+            continue
+
+        # first one wins, for queries that select the same column twice
+        index.setdefault((table_oid, desc.column_index), idx)
+
+    return index
+
+
+def _enhance_rows(engine: IsopodPool, rows: list[DataRow]) -> Iterator[EnhancedRow]:
+    """
+    Lazily wraps a list of rows from a single query, sharing the column index between all of them.
+    """
+
+    if not rows:
+        return
+
+    # every row from a single query shares the same description.
+    column_index = _index_columns(rows[0].description)
+    for row in rows:
+        yield EnhancedRow(engine, row, column_index)
+
+
 class EnhancedRow:
     """
     A wrapper around a :class:`.DataRow` that allows looking values up by column.
     """
 
-    def __init__(self, engine: IsopodPool, row: DataRow) -> None:  # noqa: D107
+    __slots__ = ("_column_index", "_engine", "_row")
+
+    def __init__(  # noqa: D107
+        self,
+        engine: IsopodPool,
+        row: DataRow,
+        column_index: ColumnIndex | None = None,
+    ) -> None:
         self._engine = engine
         self._row = row
+        self._column_index = column_index
+
+    def _find_column(self, key: Column[Any]) -> int | None:
+        """
+        Finds the position of the specified column in this row, or None if it isn't in this row.
+        """
+
+        column_key = self._engine._column_keys.get(key)
+        if column_key is None:
+            return None
+
+        if self._column_index is None:
+            self._column_index = _index_columns(self._row.description)
+
+        return self._column_index.get(column_key)
 
     @overload
     def __getitem__(self, key: int, /) -> Any: ...
@@ -156,22 +280,20 @@ class EnhancedRow:
     def __getitem__[T](self, key: Column[T], /) -> T: ...
 
     def __getitem__[T](self, key: Column[T] | int, /) -> T:
-        if isinstance(key, int):
-            return cast(Any, self._row.data[key])
+        row = self._row
 
-        table_type = key.owner
-        table_instance = self._engine._schemas[table_type]
-        column_idx = table_instance.column_mapping[key]
+        if isinstance(key, int):
+            return cast(Any, row.data[key])
 
-        for idx, desc in enumerate(self._row.description.columns):
-            if desc.table_oid == table_instance.oid and desc.column_index == column_idx:
-                data = self._row.data[idx]
-                if data is None:
-                    raise KeyError(f"Column {key.name} has a NULL value")
+        idx = self._find_column(key)
+        if idx is None:
+            raise KeyError(f"No such column {key.name} in this row")
 
-                return cast(T, self._row.data[idx])  # type: ignore  # pylance fix
+        data = row.data[idx]
+        if data is None:
+            raise KeyError(f"Column {key.name} has a NULL value")
 
-        raise KeyError(f"No such column {key.name} in this row")
+        return cast(T, data)  # type: ignore  # pylance fix
 
     @overload
     def get(self, key: int, /) -> Any | None: ...
@@ -187,11 +309,20 @@ class EnhancedRow:
         :returns: The value, or ``None`` if there is no such value in this row.
         """
 
-        try:
-            return self[key]
-        except KeyError:
+        # not implemented in terms of __getitem__, to avoid building (and then throwing away) a
+        # KeyError for every missing column.
+        row = self._row
+
+        if isinstance(key, int):
+            # out of bounds indexes are an error, not a missing value.
+            return cast("T | None", row.data[key])
+
+        idx = self._find_column(key)
+        if idx is None:
             return None
 
+        return cast("T | None", row.data[idx])
+
 
 async def create_table_schemas(
     conn: pg_purepy.PooledDatabaseInterface,
@@ -201,50 +332,30 @@ async def create_table_schemas(
     """
     Loads internal PostgreSQL schema data from the database.
 
+    Loaded schemas are cached per pool; loading the same set of schema types again will not
+    touch the database. Use :func:`.invalidate_schema_cache` after changing the tables.
+
     :param conn: The :class:`.PooledDatabaseInterface` to load the schema data for.
     :param schema_types: An iterable of :class:`.TableSchema` type instances to process.
     :param strict: If True, missing data will raise an error instead
     """
 
-    async def backfill_table_data(table: type[TableSchema]) -> TableSchema | None:
-        # the "easy" way of doing this is to_regtype($1)::regtype::oid
-        # but, sadly, no.
+    schema_types = list(schema_types)
 
-        try:
-            oid_row = await conn.fetch_one(
-                "SELECT oid FROM pg_class WHERE relname = $1 AND relkind = 'r';",
-                table.table_name,
-            )
-        except pg_purepy.MissingRowError as e:
-            if strict:
-                raise SchemaLoadFailedError(f"Unknown table {table.table_name}") from e
+    pool_cache = _SCHEMA_CACHE.setdefault(conn, {})
+    cache_key = (frozenset(schema_types), strict)
+    if (cached := pool_cache.get(cache_key)) is not None:
+        logger.debug("Using cached table schemas", tables=[i.table_name for i in schema_types])
+        return cached
 
-            logger.warning("Missing table", table=table.table_name)
-            return None
-
-        oid: int = cast(int, oid_row.data[0])
+    def backfill_table_data(
+        table: type[TableSchema], oid: int, columns: list[tuple[str, int]]
+    ) -> TableSchema:
         schema = table(table_oid=oid)
 
         logger.debug("Loaded table OID", oid=oid, table=table.table_name)
 
-        # the confusingly named ``pg_attribute`` table stores all of the actual columns...
-        # attnum: The number of the column. Ordinary columns are numbered from 1 up.
-        #         System columns, such as ctid, have (arbitrary) negative numbers.
-
-        column_rows = await conn.fetch(
-            """
-            SELECT * FROM pg_attribute
-            JOIN pg_class ON pg_attribute.attrelid = pg_class.oid
-            WHERE pg_class.oid = $1 AND pg_attribute.attnum > 0 
-            ORDER BY pg_attribute.attnum;
-            """,
-            oid,
-        )
-
-        for row in column_rows:
-            column_row_data = row.to_dict()
-            column_name = cast(str, column_row_data["attname"])
-
+        for column_name, column_oid in columns:
             if not (column := table.all_columns.get(column_name)):
                 if strict:
                     raise SchemaLoadFailedError(
@@ -256,8 +367,7 @@ async def create_table_schemas(
                 )
                 continue
 
-            column_oid = column_row_data["attnum"]
-            schema.column_mapping[column] = cast(int, column_oid)
+            schema.column_mapping[column] = column_oid
             logger.debug(
                 "Loaded column index",
                 column_name=column.name,
@@ -266,46 +376,93 @@ async def create_table_schemas(
             )
 
         if strict:
-            diff = set(table.all_columns.values()).difference(schema.column_mapping.keys())
+            diff = table._all_columns_set - schema.column_mapping.keys()
             if diff:
                 unmapped = ", ".join(i.name for i in diff)
                 raise SchemaLoadFailedError(f"Unmapped columns: {unmapped}")
 
         return schema
 
-    schemas = list(await map_as_completed(schema_types, backfill_table_data))
-    schemas = [i for i in schemas if i is not None]
+    schemas: list[TableSchema] = []
+
+    if table_names := [table.table_name for table in schema_types]:
+        # the "easy" way of doing this is to_regtype($1)::regtype::oid
+        # but, sadly, no. instead, every table and its columns are loaded in a single round-trip
+        # and split up client-side.
+        column_rows = await conn.fetch(_PG_CLASS_ATTR_QUERY, table_names)
+
+        # relname -> (table oid, [(attname, attnum), ...])
+        columns_by_table: dict[str, tuple[int, list[tuple[str, int]]]] = {}
+        for row in column_rows:
+            oid, relname, attname, attnum = cast(tuple[int, str, str, int], tuple(row.data))
+            table_oid, columns = columns_by_table.setdefault(relname, (oid, []))
+            if table_oid == oid:
+                columns.append((attname, attnum))
+
+        if missing := set(table_names) - columns_by_table.keys():
+            if strict:
+                raise SchemaLoadFailedError(f"Unknown tables: {', '.join(sorted(missing))}")
+
+            for table_name in sorted(missing):
+                logger.warning("Missing table", table=table_name)
+
+        schemas = [
+            backfill_table_data(table, *columns_by_table[table.table_name])
+            for table in schema_types
+            if table.table_name in columns_by_table
+        ]
 
-    # poor mans set, keyed by type ID
-    converters: dict[str, pg_purepy.Converter] = {}
+    # poor mans set, keyed by type name
+    converter_types: dict[str, DatabaseTypeWithConverter[Any]] = {}
+    # columns often share the same type instance (e.g. an enum used in several places), so skip
+    # those before doing anything else.
+    seen_type_ids: set[int] = set()
     for schema in schemas:
         for column in schema.all_columns.values():
             schema_type = column.type
+            if id(schema_type) in seen_type_ids:
+                continue
+
+            seen_type_ids.add(id(schema_type))
             if not isinstance(schema_type, DatabaseTypeWithConverter):
                 continue
 
-            try:
-                oid_row = await conn.fetch_one(
-                    "SELECT oid FROM pg_type WHERE typname = $1;", schema_type.postgresql_name
-                )
-                oid = cast(int, oid_row.data[0])
-            except pg_purepy.MissingRowError as e:
-                if strict:
-                    raise SchemaLoadFailedError(
-                        f"Can't find OID for type {schema_type.postgresql_name}"
-                    ) from e
+            converter_types.setdefault(schema_type.postgresql_name, schema_type)
 
-                logger.warning(
-                    "Unknown type",
-                    column=column.name,
-                    type=schema_type.postgresql_name,
-                    table=schema.table_name,
-                )
-                continue
+    converters: list[pg_purepy.Converter] = []
+
+    if converter_types:
+        type_rows = await conn.fetch(_PG_TYPE_QUERY, list(converter_types.keys()))
 
-            converters[schema_type.postgresql_name] = schema_type.create_converter(oid)
+        type_oids = {cast(str, row.data[0]): cast(int, row.data[1]) for row in type_rows}
+
+        if missing := converter_types.keys() - type_oids.keys():
+            if strict:
+                missing_types = ", ".join(sorted(missing))
+                raise SchemaLoadFailedError(f"Can't find OIDs for types: {missing_types}")
+
+            for type_name in sorted(missing):
+                logger.warning("Unknown type", type=type_name)
+
+        converters = [
+            converter_types[type_name].create_converter(oid) for type_name, oid in type_oids.items()
+        ]
+
+    loaded: _LoadedSchemas = ({type(it): it for it in schemas}, converters)
+    pool_cache[cache_key] = loaded
+    return loaded
+
+
+def invalidate_schema_cache(conn: pg_purepy.PooledDatabaseInterface) -> None:
+    """
+    Drops all of the cached schema data for the specified pool, forcing the next
+    :func:`.create_table_schemas` call to reload it from the database.
+
+    This should be called after running DDL that changes tables in use by the ORM, such as a
+    database migration.
+    """
 
-    return ({type(it): it for it in schemas}, converters.values())
+    _SCHEMA_CACHE.pop(conn, None)
 
 
 @asynccontextmanager
@@ -10,7 +10,7 @@ from infipod.types import DatabaseType
 from infipod.util import pascal_to_snake
 
 
-@attr.s(slots=True, frozen=True)
+@attr.s(slots=True, frozen=True, eq=False)
 class Column[ColumnType: Any]:
     """
     A single column in a :class:`.TableSchema`.
@@ -68,6 +68,7 @@ class _TableMeta(type):
         mcs.all_columns: dict[str, Column[DatabaseType[Any]]] = {
             i.name: i for i in klass_body.values() if isinstance(i, Column)
         }
+        mcs._all_columns_set: frozenset[Column[Any]] = frozenset(mcs.all_columns.values())
 
     def __new__(
         cls, name: str, bases: tuple[type], klass_body: dict[str, Any], **kwargs: Any
@@ -98,6 +99,9 @@ class TableSchema(metaclass=_TableMeta):
     #: A mapping of of all of the columns for this table.
     all_columns: ClassVar[Mapping[str, Column[Any]]]
 
+    # used for quickly checking for unmapped columns
+    _all_columns_set: ClassVar[frozenset[Column[Any]]]
+
     def __init__(
         self,
         *,
@@ -43,3 +43,45 @@ async def test_loading_with_enum_converter(engine: IsopodPool):
     await engine.execute("INSERT INTO example_table (field) VALUES ('ONE'::example_enum);")
     row = await engine.fetch_one("SELECT field FROM example_table;")
     assert row[ExampleTable.field] == ExampleEnum.ONE
+
+
+async def test_loading_with_shadowed_enum_type(postgresql: PooledDatabaseInterface):
+    await postgresql.execute("CREATE SCHEMA infipod_other;")
+
+    try:
+        await postgresql.execute("CREATE TYPE infipod_other.example_enum AS ENUM ('TWO');")
+        await postgresql.execute("CREATE TYPE example_enum AS ENUM ('ONE', 'TWO');")
+        await postgresql.execute(
+            "CREATE TEMPORARY TABLE example_table (id INT4, field example_enum NOT NULL);"
+        )
+
+        engine = await spawn_isopods_from_pool(postgresql, [ExampleTable])
+        await engine.execute("INSERT INTO example_table (field) VALUES ('ONE'::example_enum);")
+        row = await engine.fetch_one("SELECT field FROM example_table;")
+        assert row[ExampleTable.field] == ExampleEnum.ONE
+    finally:
+        await postgresql.execute("DROP TABLE IF EXISTS example_table;")
+        await postgresql.execute("DROP TYPE IF EXISTS example_enum;")
+        await postgresql.execute("DROP SCHEMA infipod_other CASCADE;")
+
+
+async def test_loading_with_enum_type_outside_search_path(postgresql: PooledDatabaseInterface):
+    await postgresql.execute("CREATE SCHEMA infipod_other;")
+
+    try:
+        await postgresql.execute("CREATE TYPE infipod_other.example_enum AS ENUM ('ONE', 'TWO');")
+        await postgresql.execute(
+            """
+            CREATE TEMPORARY TABLE example_table (
+                id INT4, field infipod_other.example_enum NOT NULL
+            );
+            """
+        )
+
+        engine = await spawn_isopods_from_pool(postgresql, [ExampleTable])
+        await engine.execute("INSERT INTO example_table (field) VALUES ('TWO');")
+        row = await engine.fetch_one("SELECT field FROM example_table;")
+        assert row[ExampleTable.field] == ExampleEnum.TWO
+    finally:
+        await postgresql.execute("DROP TABLE IF EXISTS example_table;")
+        await postgresql.execute("DROP SCHEMA infipod_other CASCADE;")
@@ -1,13 +1,18 @@
 import contextlib
 from collections.abc import AsyncGenerator
+from enum import IntEnum
 
 import pytest
-from infipod.engine import IsopodPool, SchemaLoadFailedError, spawn_isopods_from_pool
+from infipod.engine import (
+    IsopodPool,
+    SchemaLoadFailedError,
+    invalidate_schema_cache,
+    spawn_isopods_from_pool,
+)
 from infipod.schema import Column, TableSchema
 from infipod.types import Int4Type, TextType
 from pg_purepy import MissingRowError
 from pg_purepy.pool import PooledDatabaseInterface
-from trio.testing import RaisesGroup
 
 pytestmark = pytest.mark.anyio
 
@@ -49,10 +54,48 @@ async def test_basic_engine_connection(postgresql: PooledDatabaseInterface):
 
 
 async def test_loading_engine_without_existing_table(postgresql: PooledDatabaseInterface):
-    with RaisesGroup(SchemaLoadFailedError):
+    with pytest.raises(SchemaLoadFailedError):
         await spawn_isopods_from_pool(postgresql, [ExampleTable])
 
 
+async def test_loading_engine_reports_all_missing_tables(postgresql: PooledDatabaseInterface):
+    with pytest.raises(SchemaLoadFailedError, match="example_table, second_table"):
+        await spawn_isopods_from_pool(postgresql, [SecondTable, ExampleTable])
+
+
+async def test_loading_shadowed_table(postgresql: PooledDatabaseInterface):
+    await postgresql.execute("CREATE SCHEMA infipod_other;")
+
+    try:
+        await postgresql.execute(
+            "CREATE TABLE infipod_other.example_table (id INT4, other TEXT, field TEXT);"
+        )
+        await postgresql.execute(
+            "CREATE TEMPORARY TABLE example_table (id INT4 PRIMARY KEY, field TEXT);"
+        )
+
+        engine = await spawn_isopods_from_pool(postgresql, [ExampleTable])
+        await engine.execute("INSERT INTO example_table (id, field) VALUES (1, 'temp');")
+        row = await engine.fetch_one("SELECT id, field FROM example_table;")
+        assert row[ExampleTable.field] == "temp"
+    finally:
+        await postgresql.execute("DROP SCHEMA infipod_other CASCADE;")
+
+
+async def test_loading_table_outside_search_path(postgresql: PooledDatabaseInterface):
+    await postgresql.execute("CREATE SCHEMA infipod_other;")
+
+    try:
+        await postgresql.execute("CREATE TABLE infipod_other.second_table (id INT4);")
+
+        engine = await spawn_isopods_from_pool(postgresql, [SecondTable])
+        await engine.execute("INSERT INTO infipod_other.second_table (id) VALUES (1);")
+        row = await engine.fetch_one("SELECT id FROM infipod_other.second_table;")
+        assert row[SecondTable.id] == 1
+    finally:
+        await postgresql.execute("DROP SCHEMA infipod_other CASCADE;")
+
+
 async def test_loading_non_strict(postgresql: PooledDatabaseInterface):
     await spawn_isopods_from_pool(postgresql, [ExampleTable], strict_schema_loading=False)
 
@@ -62,7 +105,7 @@ async def test_missing_column_server_side(postgresql: PooledDatabaseInterface):
         "CREATE TEMPORARY TABLE example_table (id INT4 GENERATED ALWAYS AS IDENTITY);"
     )
 
-    with RaisesGroup(SchemaLoadFailedError):
+    with pytest.raises(SchemaLoadFailedError):
         await spawn_isopods_from_pool(postgresql, [ExampleTable])
 
 
@@ -71,7 +114,7 @@ async def test_missing_column_client_side(postgresql: PooledDatabaseInterface):
         "CREATE TEMPORARY TABLE example_table (id INT4 PRIMARY KEY, field TEXT, missing TEXT)"
     )
 
-    with RaisesGroup(SchemaLoadFailedError):
+    with pytest.raises(SchemaLoadFailedError):
         await spawn_isopods_from_pool(postgresql, [ExampleTable])
 
 
@@ -99,6 +142,14 @@ async def test_indexing_non_existent_column(engine: IsopodPool):
         row[ExampleTable.field]
 
 
+async def test_getting_non_existent_column(engine: IsopodPool):
+    await engine.execute("INSERT INTO example_table (field) VALUES ($1);", "05lifecut")
+    row = await engine.fetch_one("SELECT id FROM example_table;")
+
+    assert row.get(ExampleTable.field) is None
+    assert row.get(ExampleTable.id) is not None
+
+
 async def test_indexing_using_index(engine: IsopodPool):
     await engine.execute("INSERT INTO example_table (field) VALUES ($1);", "04kamuidrone")
     row = await engine.fetch_one("SELECT id, field FROM example_table;")
@@ -106,6 +157,17 @@ async def test_indexing_using_index(engine: IsopodPool):
     assert row[1] == "04kamuidrone"
 
 
+async def test_indexing_using_int_subclass(postgresql: PooledDatabaseInterface):
+    class Position(IntEnum):
+        SECOND = 1
+
+    engine = await spawn_isopods_from_pool(postgresql, [])
+    res = await engine.fetch_one("SELECT 1, 2;")
+
+    assert res[Position.SECOND] == 2
+    assert res.get(Position.SECOND) == 2
+
+
 async def test_checking_out_connection(engine: IsopodPool):
     # ensures the checked out connection is actually in a transaction
 
@@ -125,3 +187,32 @@ async def test_two_tables_same_index(engine: IsopodPool):
     with pytest.raises(KeyError):
         # same column_idx.
         row[SecondTable.id]
+
+
+async def test_fetch_indexing_using_column(engine: IsopodPool):
+    await engine.execute("INSERT INTO example_table (field) VALUES ('one'), ('two');")
+    rows = await engine.fetch("SELECT field, id FROM example_table ORDER BY id;")
+
+    assert [row[ExampleTable.field] for row in rows] == ["one", "two"]
+
+
+async def test_schema_loading_is_cached(postgresql: PooledDatabaseInterface):
+    await postgresql.execute("CREATE TEMPORARY TABLE second_table (id INT4 PRIMARY KEY);")
+    await spawn_isopods_from_pool(postgresql, [SecondTable])
+
+    await postgresql.execute("DROP TABLE second_table;")
+    await spawn_isopods_from_pool(postgresql, [SecondTable])
+
+    invalidate_schema_cache(postgresql)
+    with pytest.raises(SchemaLoadFailedError):
+        await spawn_isopods_from_pool(postgresql, [SecondTable])
+
+
+async def test_fetch_iter(engine: IsopodPool):
+    await engine.execute("INSERT INTO example_table (field) VALUES ('one'), ('two');")
+    fields = [
+        row[ExampleTable.field]
+        async for row in engine.fetch_iter("SELECT id, field FROM example_table ORDER BY id;")
+    ]
+
+    assert fields == ["one", "two"]
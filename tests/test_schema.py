@@ -0,0 +1,13 @@
+from infipod.schema import Column, TableSchema
+from infipod.types import Int4Type
+
+
+class CustomColumn(Column[int]):
+    pass
+
+
+def test_column_subclasses_are_collected():
+    class CustomTable(TableSchema):
+        id = CustomColumn(Int4Type())
+
+    assert CustomTable.all_columns == {"id": CustomTable.id}
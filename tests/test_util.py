@@ -0,0 +1,9 @@
+from infipod.util import pascal_to_snake
+
+
+def test_pascal_to_snake():
+    assert pascal_to_snake("MyTableName") == "my_table_name"
+    assert pascal_to_snake("table") == "table"
+    assert pascal_to_snake("_Hidden") == "hidden"
+    assert pascal_to_snake("_HiddenTable") == "hidden_table"
+    assert pascal_to_snake("ÉtatÉcole") == "état_école"